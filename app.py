@@ -6,7 +6,10 @@ from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime, timedelta
 import io
-from data_processor import DataProcessor
+import hashlib
+import calendar
+from concurrent.futures import ThreadPoolExecutor
+from data_processor import DataProcessor, POLARS_AVAILABLE, CLEANED_DATA_VERSION, combine_dataframes, join_values, join_unique_values
 from utils import FrequencyParser, DateUtils
 
 # Configure page
@@ -24,6 +27,162 @@ if 'filtered_data' not in st.session_state:
     st.session_state.filtered_data = None
 if 'combined_data' not in st.session_state:
     st.session_state.combined_data = None
+if 'data_key' not in st.session_state:
+    st.session_state.data_key = None
+if 'filter_key' not in st.session_state:
+    st.session_state.filter_key = None
+
+def _data_key(uploaded_files, fast_io=False):
+    """Content hash identifying the loaded dataset, used as a cheap cache key"""
+    digest = hashlib.sha1(str(fast_io).encode())
+    for uploaded_file in uploaded_files:
+        digest.update(uploaded_file.name.encode())
+        digest.update(uploaded_file.getvalue())
+    return digest.hexdigest()
+
+@st.cache_data(show_spinner=False, max_entries=16, persist="disk")
+def _load_csv(file_bytes, name, fast_io, cleaned_version):
+    """Parse and clean an uploaded CSV, cached on the file contents (persisted across sessions)"""
+    # cleaned_version (CLEANED_DATA_VERSION) is only part of the cache key: Streamlit keys on this
+    # function's own source, so frames pickled by older cleaning code would otherwise be reused
+    processor = DataProcessor()
+    processor.load_data(io.BytesIO(file_bytes), fast_io=fast_io)
+    return processor.df
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def apply_filters(data_key, _df, freq_hours, freq_months, year, vessels, machinery, job_actions):
+    """Filter loaded data for major machinery, cached on the data key and filter values"""
+    processor = DataProcessor()
+    processor.df = _df
+    
+    filtered_df = processor.filter_major_machinery(
+        min_hours=freq_hours,
+        min_months=freq_months,
+        year_filter=year if year != "All Years" else None,
+        vessel_filter=list(vessels) if vessels else None,
+        machinery_filter=list(machinery) if machinery else None,
+        job_action_filter=list(job_actions) if job_actions else None
+    )
+    
+    return filtered_df
+
+# Columns the date-based views (KPIs, timeline, yearly summary) read from _with_dates
+DATE_VIEW_COLUMNS = ['Vessel', 'Machinery Location', 'Job Code', 'Job_Details',
+                     'Job Status', 'Frequency', 'Department']
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _with_dates(df):
+    """Return rows with a valid due date plus Due_Date/Year/Quarter/Month columns"""
+    # Dates are parsed once at load time (DataProcessor._clean_data)
+    due_date = df['Calculated Due Date']
+    has_date = due_date.notna()
+    due_date = due_date[has_date]
+    
+    # Only carry the columns the date views use instead of copying the whole frame
+    columns = [col for col in DATE_VIEW_COLUMNS if col in df.columns]
+    return df.loc[has_date, columns].assign(
+        Due_Date=due_date,
+        Due_Year=due_date.dt.year,
+        Due_Quarter=due_date.dt.quarter,
+        Due_Month=due_date.dt.month
+    )
+
+def _overdue_count(df):
+    """Number of jobs whose due date is before now, as one vectorized datetime comparison"""
+    # NaT compares False, so missing due dates are never counted as overdue
+    return int(DateUtils.overdue_series(df['Calculated Due Date']).sum())
+
+@st.cache_data(show_spinner=False)
+def _overview_stats(df):
+    """Record, vessel, department and machinery counts for loaded data"""
+    return {
+        'records': len(df),
+        'vessels': df['Vessel'].nunique(),
+        'vessel_names': ', '.join(df['Vessel'].unique()),
+        'departments': df['Department'].nunique(),
+        'machinery_locations': df['Machinery Location'].nunique()
+    }
+
+@st.cache_data(show_spinner=False)
+def _filter_options(data_key, _df, column):
+    """Sorted distinct values of a column for the sidebar multiselects, cached per dataset"""
+    series = _df[column]
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Categories are built sorted from the loaded values, so no scan is needed
+        return list(series.cat.categories)
+    return sorted(series.dropna().unique().tolist())
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _column_stats(df):
+    """Value counts for the columns summarised across the analysis views, computed once"""
+    return {
+        'machinery_counts': df['Machinery Location'].value_counts(),
+        'job_action_counts': df['Job Action'].value_counts(),
+        'job_status_counts': df['Job Status'].value_counts(),
+        'department_counts': df['Department'].value_counts(),
+        'frequency_counts': df['Frequency'].value_counts(),
+        'vessel_names': df['Vessel'].unique()
+    }
+
+def _to_csv_bytes(df):
+    """Serialize a dataframe to CSV bytes in pandas' layout (the downloads users open directly)"""
+    # Written straight into the byte buffer in row chunks instead of building one big string
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, chunksize=50_000)
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _timeline_points(df_with_dates):
+    """Collapse jobs sharing a timeline marker (date, machinery, vessel) into one point"""
+    keys = ['Due_Date', 'Machinery Location', 'Vessel']
+    jobs = df_with_dates.groupby(keys, observed=True, dropna=False)['Due_Date'].transform('size')
+    return df_with_dates.assign(Jobs=jobs).drop_duplicates(keys)
+
+@st.cache_data(show_spinner=False)
+def _monthly_chart(monthly_dist):
+    """Bar chart of due dates per month, coloured by year"""
+    # Counts are grouped on integer months; names are only attached for display
+    month_names = list(calendar.month_name)[1:]
+    return px.bar(
+        monthly_dist.assign(Month=[calendar.month_name[m] for m in monthly_dist['Due_Month']]),
+        x='Month',
+        y='Count',
+        color='Due_Year',
+        title="Monthly Distribution of Due Dates",
+        labels={'Due_Year': 'Year', 'Count': 'Number of Jobs'},
+        category_orders={'Month': month_names}
+    )
+
+@st.cache_data(show_spinner=False)
+def _quarterly_chart(quarterly_dist):
+    """Line chart of jobs per quarter, one line per year"""
+    return px.line(
+        quarterly_dist,
+        x='Due_Quarter',
+        y='Count',
+        color='Due_Year',
+        title="Quarterly Maintenance Load",
+        labels={'Due_Quarter': 'Quarter', 'Due_Year': 'Year'},
+        markers=True
+    )
+
+@st.cache_data(show_spinner=False)
+def _bar_machinery(values, labels):
+    """Horizontal bar chart of job counts per machinery location"""
+    fig = px.bar(
+        x=values,
+        y=labels,
+        orientation='h',
+        title="Top 20 Machinery by Job Count",
+        labels={'x': 'Number of Jobs', 'y': 'Machinery Location'}
+    )
+    fig.update_layout(height=600)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _pie_chart(values, names, title):
+    """Pie chart from value/name tuples"""
+    return px.pie(values=values, names=names, title=title)
 
 def main():
     st.title("⚙️ Machinery Maintenance Analysis Tool")
@@ -40,6 +199,15 @@ def main():
             help="Choose single file for one vessel or multiple files for vessel comparison"
         )
         
+        # Fast CSV parsing is only offered when polars is installed
+        fast_io = False
+        if POLARS_AVAILABLE:
+            fast_io = st.checkbox(
+                "Fast IO (polars)",
+                value=True,
+                help="Parse CSV files with the multi-threaded polars reader"
+            )
+        
         if upload_mode == "Single File":
             uploaded_file = st.file_uploader(
                 "Upload CSV maintenance data file",
@@ -49,26 +217,19 @@ def main():
             
             if uploaded_file is not None:
                 try:
-                    # Load and process data
+                    # Load and process data (parsing is cached on the file contents)
                     with st.spinner("Processing data..."):
                         processor = DataProcessor()
-                        processor.load_data(uploaded_file)
+                        processor.df = _load_csv(uploaded_file.getvalue(), uploaded_file.name, fast_io, CLEANED_DATA_VERSION)
                         st.session_state.data_processors = {uploaded_file.name: processor}
-                        if processor.df is not None:
-                            st.session_state.combined_data = processor.df.copy()
-                        else:
-                            st.session_state.combined_data = None
+                        st.session_state.combined_data = processor.df
+                        st.session_state.data_key = _data_key([uploaded_file], fast_io)
                     
                     if st.session_state.combined_data is not None:
                         st.success(f"✅ Data loaded: {len(st.session_state.combined_data)} records")
                         
                         # Display data info
-                        st.subheader("📊 Data Overview")
-                        st.write(f"**Total Records:** {len(st.session_state.combined_data)}")
-                        st.write(f"**Vessels:** {st.session_state.combined_data['Vessel'].nunique()}")
-                        st.write(f"**Vessel Names:** {', '.join(st.session_state.combined_data['Vessel'].unique())}")
-                        st.write(f"**Departments:** {st.session_state.combined_data['Department'].nunique()}")
-                        st.write(f"**Machinery Locations:** {st.session_state.combined_data['Machinery Location'].nunique()}")
+                        display_data_overview(st.session_state.combined_data, "📊 Data Overview")
                     else:
                         st.error("Failed to load data")
                         
@@ -87,35 +248,49 @@ def main():
                 try:
                     with st.spinner("Processing multiple files..."):
                         all_dataframes = []
+                        processors = []
                         st.session_state.data_processors = {}
                         
-                        for uploaded_file in uploaded_files:
+                        # Parse files concurrently; pandas releases the GIL while parsing
+                        with ThreadPoolExecutor(max_workers=min(8, len(uploaded_files))) as executor:
+                            loaded_frames = list(executor.map(
+                                lambda f: _load_csv(f.getvalue(), f.name, fast_io, CLEANED_DATA_VERSION), uploaded_files
+                            ))
+                        
+                        for uploaded_file, df in zip(uploaded_files, loaded_frames):
                             processor = DataProcessor()
-                            processor.load_data(uploaded_file)
+                            processor.df = df
                             if processor.df is not None:
                                 st.session_state.data_processors[uploaded_file.name] = processor
+                                processors.append(processor)
                                 all_dataframes.append(processor.df)
                         
                         # Combine all dataframes
                         if all_dataframes:
-                            st.session_state.combined_data = pd.concat(all_dataframes, ignore_index=True)
+                            st.session_state.combined_data = combine_dataframes(all_dataframes)
+                            st.session_state.data_key = _data_key(uploaded_files, fast_io)
+                            
+                            # Point each file's processor at its row range of the combined frame
+                            # (a view) so the per-file frames are not kept in memory a second time
+                            start = 0
+                            for processor in processors:
+                                end = start + len(processor.df)
+                                processor.df = st.session_state.combined_data.iloc[start:end]
+                                start = end
                     
                     if st.session_state.combined_data is not None:
                         st.success(f"✅ Loaded {len(uploaded_files)} files with {len(st.session_state.combined_data)} total records")
                         
-                        # Display combined data info
-                        st.subheader("📊 Combined Data Overview")
-                        st.write(f"**Total Records:** {len(st.session_state.combined_data)}")
-                        st.write(f"**Total Vessels:** {st.session_state.combined_data['Vessel'].nunique()}")
-                        st.write(f"**Vessel Names:** {', '.join(st.session_state.combined_data['Vessel'].unique())}")
-                        st.write(f"**Departments:** {st.session_state.combined_data['Department'].nunique()}")
-                        st.write(f"**Machinery Locations:** {st.session_state.combined_data['Machinery Location'].nunique()}")
-                        
-                        # Show breakdown by file
-                        st.subheader("📋 Files Loaded")
-                        for filename, processor in st.session_state.data_processors.items():
-                            vessels = processor.df['Vessel'].unique()
-                            st.write(f"**{filename}:** {len(processor.df)} records, Vessels: {', '.join(vessels)}")
+                        # Display combined data info and breakdown by file
+                        display_data_overview(
+                            st.session_state.combined_data,
+                            "📊 Combined Data Overview",
+                            vessels_label="Total Vessels",
+                            file_frames={
+                                filename: processor.df
+                                for filename, processor in st.session_state.data_processors.items()
+                            }
+                        )
                     else:
                         st.error("Failed to load data from files")
                         
@@ -156,7 +331,9 @@ def main():
             
             # Vessel filter
             st.write("**Vessel:**")
-            all_vessels = sorted(st.session_state.combined_data['Vessel'].dropna().unique().tolist())
+            all_vessels = _filter_options(
+                st.session_state.data_key, st.session_state.combined_data, 'Vessel'
+            )
             selected_vessels = st.multiselect(
                 "Filter by Vessel (multiple selection)",
                 all_vessels,
@@ -166,7 +343,9 @@ def main():
             
             # Machinery location filter
             st.write("**Machinery Location:**")
-            all_machinery_locations = sorted(st.session_state.combined_data['Machinery Location'].dropna().unique().tolist())
+            all_machinery_locations = _filter_options(
+                st.session_state.data_key, st.session_state.combined_data, 'Machinery Location'
+            )
             selected_machinery = st.multiselect(
                 "Filter by Machinery (multiple selection)",
                 all_machinery_locations,
@@ -176,7 +355,9 @@ def main():
             
             # Job Action filter
             st.write("**Job Action:**")
-            job_actions = sorted(st.session_state.combined_data['Job Action'].dropna().unique().tolist())
+            job_actions = _filter_options(
+                st.session_state.data_key, st.session_state.combined_data, 'Job Action'
+            )
             selected_job_actions = st.multiselect(
                 "Filter by Job Action (multiple selection)",
                 job_actions,
@@ -193,19 +374,22 @@ def main():
                     st.session_state.current_vessels = selected_vessels
                     st.session_state.current_job_actions = selected_job_actions
                     
-                    # Create a temporary processor for filtering
-                    temp_processor = DataProcessor()
-                    temp_processor.df = st.session_state.combined_data.copy()
-                    
-                    st.session_state.filtered_data = temp_processor.filter_major_machinery(
-                        min_hours=freq_hours,
-                        min_months=freq_months,
-                        year_filter=date_range if date_range != "All Years" else None,
-                        vessel_filter=selected_vessels if selected_vessels else None,
-                        machinery_filter=selected_machinery if selected_machinery else None,
-                        job_action_filter=selected_job_actions if selected_job_actions else None
+                    # Filter values are passed as tuples so they can be hashed for caching;
+                    # the loaded frame itself is identified by its data key instead of being hashed
+                    st.session_state.filter_key = (
+                        st.session_state.data_key,
+                        freq_hours,
+                        freq_months,
+                        date_range,
+                        tuple(selected_vessels),
+                        tuple(selected_machinery),
+                        tuple(selected_job_actions)
+                    )
+                    st.session_state.filtered_data = apply_filters(
+                        st.session_state.data_key,
+                        st.session_state.combined_data,
+                        *st.session_state.filter_key[1:]
                     )
-                st.rerun()
     
     # Main content area
     if st.session_state.combined_data is not None and st.session_state.filtered_data is not None:
@@ -245,6 +429,24 @@ def display_welcome():
     - **Months**: Maintenance intervals greater than specified months (default: 30+ months)
     """)
 
+def display_data_overview(df, title, vessels_label="Vessels", file_frames=None):
+    """Display the loaded-data summary in the sidebar"""
+    stats = _overview_stats(df)
+    
+    st.subheader(title)
+    st.write(f"**Total Records:** {stats['records']}")
+    st.write(f"**{vessels_label}:** {stats['vessels']}")
+    st.write(f"**Vessel Names:** {stats['vessel_names']}")
+    st.write(f"**Departments:** {stats['departments']}")
+    st.write(f"**Machinery Locations:** {stats['machinery_locations']}")
+    
+    # Show breakdown by file
+    if file_frames:
+        st.subheader("📋 Files Loaded")
+        for filename, file_df in file_frames.items():
+            file_stats = _overview_stats(file_df)
+            st.write(f"**{filename}:** {file_stats['records']} records, Vessels: {file_stats['vessel_names']}")
+
 def display_analysis():
     """Display the main analysis dashboard"""
     filtered_df = st.session_state.filtered_data
@@ -253,8 +455,8 @@ def display_analysis():
         st.warning("⚠️ No records match the current filter criteria. Try adjusting the frequency thresholds.")
         return
     
-    # Create combined Job Code + Title column for better display
-    filtered_df['Job_Details'] = filtered_df['Job Code'].astype(str) + " - " + filtered_df['Title'].astype(str)
+    # Column summaries shared by the metrics, tabs and report
+    stats = _column_stats(filtered_df)
     
     # Key metrics
     col1, col2, col3, col4, col5 = st.columns(5)
@@ -263,44 +465,48 @@ def display_analysis():
         st.metric("Major Machinery Items", len(filtered_df))
     
     with col2:
-        pending_count = len(filtered_df[filtered_df['Job Status'] == 'Pending'])
+        pending_count = int(stats['job_status_counts'].get('Pending', 0))
         st.metric("Pending Jobs", pending_count)
     
     with col3:
-        overdue_count = len(filtered_df[
-            (filtered_df['Calculated Due Date'].notna()) & 
-            (pd.to_datetime(filtered_df['Calculated Due Date'], errors='coerce') < datetime.now())
-        ])
+        overdue_count = _overdue_count(filtered_df)
         st.metric("Overdue Items", overdue_count)
     
     with col4:
-        unique_machinery = filtered_df['Machinery Location'].nunique()
+        unique_machinery = len(stats['machinery_counts'])
         st.metric("Unique Machinery", unique_machinery)
     
     with col5:
-        unique_vessels = filtered_df['Vessel'].nunique()
+        unique_vessels = int(pd.notna(stats['vessel_names']).sum())
         st.metric("Vessels", unique_vessels)
     
     # Display vessel names prominently
     if 'Vessel' in filtered_df.columns:
-        vessel_names = filtered_df['Vessel'].unique()
+        vessel_names = stats['vessel_names']
         st.info(f"🚢 **Vessels in Analysis:** {', '.join(vessel_names)}")
     
     # Vessel KPIs Summary Table
     st.subheader("📈 Vessel KPIs - Machinery Count by Year & Quarter")
     display_vessel_kpis_summary(filtered_df)
     
-    # Tabs for different analyses
-    tab1, tab2, tab3 = st.tabs(["📅 Yearly Analysis", "🔧 Machinery wise analysis", "📋 Data Export"])
+    # Tabs for different analyses (switching tabs reruns, so only the open tab is computed)
+    tab1, tab2, tab3 = st.tabs(
+        ["📅 Yearly Analysis", "🔧 Machinery wise analysis", "📋 Data Export"],
+        key="analysis_tabs",
+        on_change="rerun"
+    )
     
     with tab1:
-        display_yearly_analysis(filtered_df)
+        if tab1.open:
+            display_yearly_analysis(filtered_df)
     
     with tab2:
-        display_machinery_breakdown(filtered_df)
+        if tab2.open:
+            display_machinery_breakdown(filtered_df, stats)
     
     with tab3:
-        display_export_options(filtered_df)
+        if tab3.open:
+            display_export_options(filtered_df)
 
 def display_vessel_kpis_summary(df):
     """Display vessel KPIs as a clean summary table with color formatting"""
@@ -308,103 +514,52 @@ def display_vessel_kpis_summary(df):
         st.warning("No vessel data available for KPI analysis.")
         return
     
-    # Parse due dates and extract year/quarter
-    df_copy = df.copy()
-    df_copy['Due_Date'] = pd.to_datetime(df_copy['Calculated Due Date'], errors='coerce')
-    df_copy['Year'] = df_copy['Due_Date'].dt.year
-    df_copy['Quarter'] = df_copy['Due_Date'].dt.quarter
-    
-    # Filter out rows with invalid dates
-    df_with_dates = df_copy[df_copy['Due_Date'].notna()]
+    # Rows with valid due dates and their year/quarter (shared, cached parse)
+    df_with_dates = _with_dates(df)
     
     if df_with_dates.empty:
         st.warning("No valid due dates found for KPI analysis.")
         return
     
     # Create pivot table: Vessel -> Year -> Quarter -> Job Count (not unique machinery)
-    kpi_data = []
-    
-    for vessel in sorted(df_with_dates['Vessel'].unique()):
-        vessel_data = df_with_dates[df_with_dates['Vessel'] == vessel]
-        
-        for year in sorted(vessel_data['Year'].unique()):
-            year_data = vessel_data[vessel_data['Year'] == year]
-            
-            # Total jobs for the year (not unique machinery count)
-            year_job_count = len(year_data)
-            
-            # Quarterly breakdown - count of jobs, not unique machinery
-            for quarter in [1, 2, 3, 4]:
-                quarter_data = year_data[year_data['Quarter'] == quarter]
-                quarter_job_count = len(quarter_data) if not quarter_data.empty else 0
-                
-                kpi_data.append({
-                    'Vessel': vessel,
-                    'Year': int(year),
-                    'Quarter': f'Q{quarter}',
-                    'Job_Count': quarter_job_count,
-                    'Year_Total': year_job_count
-                })
-    
-    if not kpi_data:
-        st.warning("No KPI data available.")
-        return
-    
-    kpi_df = pd.DataFrame(kpi_data)
-    
-    # Create pivot table for better visualization
-    pivot_table = kpi_df.pivot_table(
-        index=['Vessel', 'Year'], 
-        columns='Quarter', 
-        values='Job_Count', 
-        fill_value=0,
-        aggfunc='sum'
+    pivot_table = (
+        df_with_dates.groupby(['Vessel', 'Due_Year', 'Due_Quarter'], observed=True)
+        .size()
+        .unstack('Due_Quarter', fill_value=0)
+        .reindex(columns=[1, 2, 3, 4], fill_value=0)
+        .rename(columns={1: 'Q1', 2: 'Q2', 3: 'Q3', 4: 'Q4'})
+        .rename_axis(index={'Due_Year': 'Year'}, columns=None)
     )
     
-    # Add year totals
-    pivot_table['Year Total'] = kpi_df.groupby(['Vessel', 'Year'])['Year_Total'].first()
-    
-    # Format column names for better display
-    pivot_table.columns = ['Q1', 'Q2', 'Q3', 'Q4', 'Year Total']
-    
-    # Apply color formatting to the dataframe
-    def color_cells(val):
-        if val == 0:
-            return 'background-color: #c3e6cb; color: #333333'  # Dark green for zero
-        elif val <= 10:
-            return 'background-color: #d4edda; color: #333333'  # Light green for low values
-        elif val <= 50:
-            return 'background-color: #fff2cc; color: #333333'  # Light yellow for medium values
-        else:
-            return 'background-color: #ffcccc; color: #333333'  # Light red for high values
-    
-    # Style the dataframe with colors and formatting
-    styled_table = pivot_table.style.map(color_cells).format({
-        'Q1': '{:.0f}',
-        'Q2': '{:.0f}', 
-        'Q3': '{:.0f}',
-        'Q4': '{:.0f}',
-        'Year Total': '{:.0f}'
-    }).set_table_styles([
-        {'selector': 'th', 'props': [
-            ('background-color', '#4472C4'),
-            ('color', 'white'),
-            ('font-weight', 'bold'),
-            ('text-align', 'center'),
-            ('padding', '10px')
-        ]},
-        {'selector': 'td', 'props': [
-            ('text-align', 'center'),
-            ('padding', '8px'),
-            ('font-weight', 'bold'),
-            ('border', '1px solid #ddd')
-        ]},
-        {'selector': 'tr:hover', 'props': [
-            ('background-color', '#f5f5f5')
-        ]}
-    ])
-    
-    st.dataframe(styled_table, use_container_width=True)
+    # Add year totals (total jobs for the year, not unique machinery count)
+    pivot_table['Year Total'] = pivot_table.sum(axis=1)
+    
+    # Apply color formatting to the whole table in one vectorized pass
+    def color_table(table):
+        vals = table.to_numpy()
+        colors = np.select(
+            [vals == 0, vals <= 10, vals <= 50],
+            [
+                'background-color: #c3e6cb; color: #333333',  # Dark green for zero
+                'background-color: #d4edda; color: #333333',  # Light green for low values
+                'background-color: #fff2cc; color: #333333'   # Light yellow for medium values
+            ],
+            default='background-color: #ffcccc; color: #333333'  # Light red for high values
+        )
+        return pd.DataFrame(colors, index=table.index, columns=table.columns)
+    
+    # Style only the cell colours; st.dataframe ignores Styler table styles, and number
+    # formatting is handled natively through column_config
+    styled_table = pivot_table.style.apply(color_table, axis=None)
+    
+    st.dataframe(
+        styled_table,
+        width="stretch",
+        column_config={
+            col: st.column_config.NumberColumn(col, format="%d")
+            for col in ['Q1', 'Q2', 'Q3', 'Q4', 'Year Total']
+        }
+    )
     
     # Add legend for color coding
     st.markdown("""
@@ -419,118 +574,91 @@ def display_yearly_analysis(df):
     """Display yearly analysis of due dates"""
     st.header("📅 Yearly Maintenance Schedule Analysis")
     
-    # Parse dates and create yearly breakdown
-    df_with_dates = df.copy()
-    df_with_dates['Due Date Parsed'] = pd.to_datetime(df_with_dates['Calculated Due Date'], errors='coerce')
-    df_with_dates = df_with_dates.dropna(subset=['Due Date Parsed'])
+    # Rows with valid due dates and their year/quarter/month (shared, cached parse)
+    df_with_dates = _with_dates(df)
     
     if df_with_dates.empty:
         st.warning("No valid due dates found in the filtered data.")
         return
     
-    df_with_dates['Year'] = df_with_dates['Due Date Parsed'].dt.year
-    df_with_dates['Month'] = df_with_dates['Due Date Parsed'].dt.month
-    df_with_dates['Quarter'] = df_with_dates['Due Date Parsed'].dt.quarter
-    
-    # Yearly summary
-    yearly_summary = df_with_dates.groupby('Year').agg({
-        'Job Code': 'count',
-        'Job Status': lambda x: (x == 'Pending').sum(),
-        'Department': lambda x: x.nunique()
-    }).rename(columns={
-        'Job Code': 'Total Jobs',
-        'Job Status': 'Pending Jobs',
-        'Department': 'Unique Departments'
-    })
+    # Yearly summary (named built-in aggregations, no per-group lambdas)
+    yearly_summary = df_with_dates.assign(
+        Pending=df_with_dates['Job Status'] == 'Pending'
+    ).groupby('Due_Year').agg(**{
+        'Total Jobs': ('Job Code', 'count'),
+        'Pending Jobs': ('Pending', 'sum'),
+        'Unique Departments': ('Department', 'nunique')
+    }).rename_axis('Year')
     
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        # Timeline chart
+        # Timeline chart (WebGL, one marker per position so the browser only receives
+        # points it can actually draw; hover shows how many jobs share the marker)
         fig_timeline = px.scatter(
-            df_with_dates,
-            x='Due Date Parsed',
+            _timeline_points(df_with_dates),
+            x='Due_Date',
             y='Machinery Location',
             color='Vessel',
-            hover_data=['Job_Details', 'Job Status', 'Frequency', 'Department'],
-            title="Maintenance Timeline by Machinery and Vessel"
+            hover_data=['Jobs', 'Job_Details', 'Job Status', 'Frequency', 'Department'],
+            title="Maintenance Timeline by Machinery and Vessel",
+            labels={'Due_Date': 'Due Date'},
+            render_mode='webgl'
         )
         fig_timeline.update_layout(height=600)
-        st.plotly_chart(fig_timeline, use_container_width=True)
+        st.plotly_chart(fig_timeline, width="stretch", key="timeline_chart")
     
     with col2:
         st.subheader("Yearly Summary")
-        st.dataframe(yearly_summary, use_container_width=True)
+        st.dataframe(yearly_summary, width="stretch")
     
     # Monthly distribution
-    monthly_dist = df_with_dates.groupby(['Year', 'Month']).size().reset_index(name='Count')
+    monthly_dist = df_with_dates.groupby(['Due_Year', 'Due_Month']).size().reset_index(name='Count')
     
-    fig_monthly = px.bar(
-        monthly_dist,
-        x='Month',
-        y='Count',
-        color='Year',
-        title="Monthly Distribution of Due Dates",
-        labels={'Month': 'Month', 'Count': 'Number of Jobs'}
-    )
-    st.plotly_chart(fig_monthly, use_container_width=True)
+    fig_monthly = _monthly_chart(monthly_dist)
+    st.plotly_chart(fig_monthly, width="stretch", key="monthly_chart")
     
     # Quarterly analysis
-    quarterly_dist = df_with_dates.groupby(['Year', 'Quarter']).size().reset_index(name='Count')
+    quarterly_dist = df_with_dates.groupby(['Due_Year', 'Due_Quarter']).size().reset_index(name='Count')
     
-    fig_quarterly = px.line(
-        quarterly_dist,
-        x='Quarter',
-        y='Count',
-        color='Year',
-        title="Quarterly Maintenance Load",
-        markers=True
-    )
-    st.plotly_chart(fig_quarterly, use_container_width=True)
+    fig_quarterly = _quarterly_chart(quarterly_dist)
+    st.plotly_chart(fig_quarterly, width="stretch", key="quarterly_chart")
 
 
 
-def display_machinery_breakdown(df):
+def display_machinery_breakdown(df, stats=None):
     """Display machinery-specific breakdown"""
     st.header("🔧 Machinery Breakdown Analysis")
     
+    if stats is None:
+        stats = _column_stats(df)
+    
     # Note: df is already filtered for major machinery based on frequency criteria
     
     # Top machinery by job count
-    machinery_counts = df['Machinery Location'].value_counts().head(20)
+    machinery_counts = stats['machinery_counts'].head(20)
     
-    fig_machinery = px.bar(
-        x=machinery_counts.values,
-        y=machinery_counts.index,
-        orientation='h',
-        title="Top 20 Machinery by Job Count",
-        labels={'x': 'Number of Jobs', 'y': 'Machinery Location'}
-    )
-    fig_machinery.update_layout(height=600)
-    st.plotly_chart(fig_machinery, use_container_width=True)
+    fig_machinery = _bar_machinery(tuple(machinery_counts.values), tuple(machinery_counts.index))
+    st.plotly_chart(fig_machinery, width="stretch", key="machinery_chart")
     
     # Job action distribution
-    action_dist = df['Job Action'].value_counts()
+    action_dist = stats['job_action_counts']
     
     col1, col2 = st.columns(2)
     
     with col1:
-        fig_actions = px.pie(
-            values=action_dist.values,
-            names=action_dist.index,
-            title="Distribution of Job Actions"
+        fig_actions = _pie_chart(
+            tuple(action_dist.values), tuple(action_dist.index), "Distribution of Job Actions"
         )
-        st.plotly_chart(fig_actions, use_container_width=True)
+        st.plotly_chart(fig_actions, width="stretch", key="job_action_chart")
     
     with col2:
         # Status distribution
-        status_dist = df['Job Status'].value_counts()
-        fig_status = px.pie(
-            values=status_dist.values,
-            names=status_dist.index,
-            title="Distribution of Job Status"
+        status_dist = stats['job_status_counts']
+        fig_status = _pie_chart(
+            tuple(status_dist.values), tuple(status_dist.index), "Distribution of Job Status"
         )
-        st.plotly_chart(fig_status, use_container_width=True)
+        st.plotly_chart(fig_status, width="stretch", key="job_status_chart")
     
     # Detailed machinery table
     st.subheader("Detailed Machinery Information (Pending Jobs Only - Major Machinery)")
@@ -542,7 +670,7 @@ def display_machinery_breakdown(df):
         filtered_df = df
     
     # Filter for pending jobs only
-    pending_df = filtered_df[filtered_df['Job Status'] == 'Pending'].copy()
+    pending_df = filtered_df[filtered_df['Job Status'] == 'Pending']
     
     # Apply job action filter if any are stored in session state
     if hasattr(st.session_state, 'current_job_actions') and st.session_state.current_job_actions:
@@ -560,7 +688,7 @@ def display_machinery_breakdown(df):
     st.info(f"📋 Showing pending jobs for machinery with frequency ≥ {freq_hours} hours OR ≥ {freq_months} months")
     
     # Show count of filtered vs total
-    total_pending = len(df[df['Job Status'] == 'Pending'])
+    total_pending = int((df['Job Status'] == 'Pending').sum())
     major_pending = len(pending_df)
     st.write(f"**Filtered Results:** {major_pending} pending jobs for major machinery (out of {total_pending} total pending jobs)")
     
@@ -569,36 +697,20 @@ def display_machinery_breakdown(df):
     vessel_names = ', '.join(pending_df['Vessel'].unique())
     st.write(f"**Vessels:** {unique_vessels} vessel(s) - {vessel_names}")
     
-    # Create detailed summary by machinery location for pending jobs only
-    machinery_details = pending_df.groupby('Machinery Location').agg({
-        'Job Code': lambda x: ', '.join(x.dropna().astype(str)) + f' (Total: {len(x)})',
-        'Title': lambda x: ', '.join(x.dropna().astype(str)) + f' (Total: {len(x)})',
-        'Job Status': 'count',  # All are pending, so just count them
-        'Vessel': lambda x: ', '.join(x.dropna().astype(str).unique()),
-        'Department': lambda x: ', '.join(x.dropna().astype(str).unique()),
-        'Frequency': lambda x: ', '.join(x.dropna().astype(str).unique()),
-        'Calculated Due Date': lambda x: x.min() if x.notna().any() else None
-    })
-    
-    # Rename columns
-    machinery_details.columns = ['Job Codes', 'Job Titles', 'Pending Jobs', 'Vessels', 'Departments', 'Frequencies', 'Next Due Date']
-    
-    # Add total job count as separate column (from pending jobs only)
-    machinery_details['Total Jobs'] = pending_df.groupby('Machinery Location').size()
-    
-    # Reorder columns
-    machinery_details = machinery_details[['Total Jobs', 'Pending Jobs', 'Vessels', 'Job Codes', 'Job Titles', 'Departments', 'Frequencies', 'Next Due Date']]
+    # Summary table and both CSV exports, cached on the active filters
+    machinery_details, csv_detailed, csv_full_detailed = _pending_machinery_details(
+        st.session_state.filter_key, pending_df
+    )
     
     col1, col2 = st.columns([3, 1])
     
     with col1:
-        st.dataframe(machinery_details, use_container_width=True, height=600)
+        st.dataframe(machinery_details, width="stretch", height=600)
     
     with col2:
         st.subheader("Export Options")
         
         # Export detailed machinery information
-        csv_detailed = machinery_details.to_csv()
         st.download_button(
             label="📥 Download Detailed Machinery Info (CSV)",
             data=csv_detailed,
@@ -607,11 +719,6 @@ def display_machinery_breakdown(df):
         )
         
         # Also provide full detailed records export (pending jobs only)
-        full_detailed_view = pending_df[['Vessel', 'Machinery Location', 'Job Code', 'Title', 'Job_Details', 'Frequency', 
-                                       'Calculated Due Date', 'Job Status', 'Department', 'Performing Rank']].copy()
-        full_detailed_view = full_detailed_view.sort_values(['Machinery Location', 'Calculated Due Date'])
-        
-        csv_full_detailed = full_detailed_view.to_csv(index=False)
         st.download_button(
             label="📋 Download Pending Records (CSV)",
             data=csv_full_detailed,
@@ -628,9 +735,43 @@ def display_machinery_breakdown(df):
         st.metric("Total Jobs", total_jobs)
         st.metric("Pending Jobs", total_pending)
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def _pending_machinery_details(filter_key, _pending_df):
+    """Per-location summary of pending jobs plus its CSV exports, cached on the filter key"""
+    pending_df = _pending_df
+    
+    # Create detailed summary by machinery location for pending jobs only
+    # (counts and dates use built-in aggregations; text columns are joined per column)
+    grouped = pending_df.groupby('Machinery Location', observed=True)
+    total_jobs = grouped.size()
+    location_index = total_jobs.index
+    totals_suffix = ' (Total: ' + total_jobs.astype(str) + ')'
+    
+    machinery_details = pd.DataFrame({
+        'Total Jobs': total_jobs,
+        'Pending Jobs': grouped['Job Status'].count(),  # All are pending, so just count them
+        'Vessels': join_unique_values(pending_df, 'Machinery Location', 'Vessel').reindex(location_index, fill_value=''),
+        'Job Codes': join_values(pending_df, 'Machinery Location', 'Job Code').reindex(location_index, fill_value='') + totals_suffix,
+        'Job Titles': join_values(pending_df, 'Machinery Location', 'Title').reindex(location_index, fill_value='') + totals_suffix,
+        'Departments': join_unique_values(pending_df, 'Machinery Location', 'Department').reindex(location_index, fill_value=''),
+        'Frequencies': join_unique_values(pending_df, 'Machinery Location', 'Frequency').reindex(location_index, fill_value=''),
+        'Next Due Date': grouped['Calculated Due Date'].min()
+    }, index=location_index)
+    
+    # Export detailed machinery information
+    csv_detailed = machinery_details.to_csv()
+    
+    # Also provide full detailed records export (pending jobs only)
+    full_detailed_view = pending_df[['Vessel', 'Machinery Location', 'Job Code', 'Title', 'Job_Details', 'Frequency', 
+                                   'Calculated Due Date', 'Job Status', 'Department', 'Performing Rank']]
+    full_detailed_view = full_detailed_view.sort_values(['Machinery Location', 'Calculated Due Date'])
+    csv_full_detailed = _to_csv_bytes(full_detailed_view)
+    
+    return machinery_details, csv_detailed, csv_full_detailed
+
 def prepare_export_data(df):
     """Prepare data for export with specified columns and naming"""
-    export_df = df.copy()
+    export_df = df  # only read from, so no copy is needed
     
     # Define the exact column order based on the original data, excluding "Unnamed: 3"
     export_columns = [
@@ -660,29 +801,40 @@ def prepare_export_data(df):
         'Job_Details'
     ]
     
-    # Create export dataframe with specified columns
-    export_data = pd.DataFrame()
-    
-    for col in export_columns:
-        if col == 'Critical Job':
-            # Use original 'Unnamed: 0' data if available, otherwise create sequential numbers
-            if 'Unnamed: 0' in export_df.columns:
-                export_data[col] = export_df['Unnamed: 0']
-            else:
-                export_data[col] = range(1, len(export_df) + 1)
-        elif col == 'Job_Details':
-            # Use the combined Job Code + Title column we created, or create it if missing
-            if 'Job_Details' in export_df.columns:
-                export_data[col] = export_df['Job_Details']
-            else:
-                job_code = export_df.get('Job Code', '').astype(str)
-                title = export_df.get('Title', '').astype(str)
-                export_data[col] = job_code + " - " + title
-        else:
-            # Use existing column if available, otherwise create empty column
-            export_data[col] = export_df.get(col, '')
-    
-    return export_data
+    # Derived columns are built as whole Series
+    derived_columns = {}
+    
+    # Use original 'Unnamed: 0' data if available, otherwise create sequential numbers
+    if 'Unnamed: 0' in export_df.columns:
+        derived_columns['Critical Job'] = export_df['Unnamed: 0']
+    else:
+        derived_columns['Critical Job'] = pd.Series(range(1, len(export_df) + 1), index=export_df.index)
+    
+    # Use the combined Job Code + Title column we created, or create it if missing
+    if 'Job_Details' not in export_df.columns:
+        job_code = export_df.get('Job Code', '').astype(str)
+        title = export_df.get('Title', '').astype(str)
+        derived_columns['Job_Details'] = job_code + " - " + title
+    
+    # Select the export columns in one reindex; missing columns are created empty
+    return export_df.assign(**derived_columns).reindex(columns=export_columns, fill_value='')
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _export_csv(filter_key, _df):
+    """CSV bytes of the prepared export frame, cached on the filter key"""
+    return _to_csv_bytes(prepare_export_data(_df))
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _preview_csv(filter_key, _preview_df):
+    """CSV bytes of the data preview columns, cached on the filter key"""
+    return _to_csv_bytes(_preview_df)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _preview_parquet(filter_key, _preview_df):
+    """Parquet bytes of the data preview columns (columnar, no per-cell text formatting)"""
+    buffer = io.BytesIO()
+    _preview_df.to_parquet(buffer, engine='pyarrow', compression='zstd', index=False)
+    return buffer.getvalue()
 
 def display_export_options(df):
     """Display data export options"""
@@ -693,13 +845,8 @@ def display_export_options(df):
     with col1:
         st.subheader("Export Filtered Data")
         
-        # Prepare export data with specified columns and order
-        export_df = prepare_export_data(df)
-        
-        # CSV export
-        csv_buffer = io.StringIO()
-        export_df.to_csv(csv_buffer, index=False)
-        csv_data = csv_buffer.getvalue()
+        # Export data with specified columns and order, serialized once per filter key
+        csv_data = _export_csv(st.session_state.filter_key, df)
         
         st.download_button(
             label="📥 Download Filtered Data (CSV)",
@@ -712,12 +859,11 @@ def display_export_options(df):
     with col2:
         st.subheader("Analysis Report")
         
-        # Generate analysis report
-        report = generate_analysis_report(df)
-        
+        # The report is only generated when the button is clicked (Streamlit calls the
+        # function for the download), so reruns that never download it skip the work
         st.download_button(
             label="📊 Download Analysis Report (TXT)",
-            data=report,
+            data=lambda: generate_analysis_report(df),
             file_name=f"maintenance_analysis_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
             mime="text/plain"
         )
@@ -732,42 +878,48 @@ def display_export_options(df):
     preview_df = df[available_columns]
     
     st.write(f"**Complete Filtered Data:** {len(preview_df)} records")
-    st.dataframe(preview_df, use_container_width=True, height=400)
+    st.dataframe(preview_df, width="stretch", height=400)
     
-    # Download option for complete preview data
-    preview_csv = preview_df.to_csv(index=False)
+    # Download option for complete preview data (bytes cached on the filter key)
+    preview_csv = _preview_csv(st.session_state.filter_key, preview_df)
     st.download_button(
         label="📥 Download Complete Preview Data (CSV)",
         data=preview_csv,
         file_name=f"filtered_data_preview_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
         mime="text/csv"
     )
+    
+    # Same preview as Parquet, which keeps the column types and is much smaller
+    preview_parquet = _preview_parquet(st.session_state.filter_key, preview_df)
+    st.download_button(
+        label="📥 Download Complete Preview Data (Parquet)",
+        data=preview_parquet,
+        file_name=f"filtered_data_preview_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet",
+        mime="application/octet-stream"
+    )
 
-def generate_analysis_report(df):
-    """Generate a text-based analysis report"""
-    report = f"""
-MACHINERY MAINTENANCE ANALYSIS REPORT
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-SUMMARY STATISTICS:
-- Total Major Machinery Records: {len(df)}
-- Unique Machinery Locations: {df['Machinery Location'].nunique()}
-- Departments Involved: {df['Department'].nunique()}
-- Pending Jobs: {len(df[df['Job Status'] == 'Pending'])}
-- Overdue Items: {len(df[(df['Calculated Due Date'].notna()) & (pd.to_datetime(df['Calculated Due Date'], errors='coerce') < datetime.now())])}
-
-TOP 10 MACHINERY BY JOB COUNT:
-{df['Machinery Location'].value_counts().head(10).to_string()}
+@st.cache_data(show_spinner=False, max_entries=32)
+def _report_sections(df):
+    """Build the time-independent parts of the analysis report once per filtered frame"""
+    stats = _column_stats(df)
+    
+    summary = f"""- Total Major Machinery Records: {len(df)}
+- Unique Machinery Locations: {len(stats['machinery_counts'])}
+- Departments Involved: {len(stats['department_counts'])}
+- Pending Jobs: {int(stats['job_status_counts'].get('Pending', 0))}"""
+    
+    details = f"""TOP 10 MACHINERY BY JOB COUNT:
+{stats['machinery_counts'].head(10).to_string()}
 
 JOB ACTION DISTRIBUTION:
-{df['Job Action'].value_counts().to_string()}
+{stats['job_action_counts'].to_string()}
 
 DEPARTMENT BREAKDOWN:
-{df['Department'].value_counts().to_string()}
+{stats['department_counts'].to_string()}
 
 FREQUENCY ANALYSIS:
 Most Common Frequencies:
-{df['Frequency'].value_counts().head(10).to_string()}
+{stats['frequency_counts'].head(10).to_string()}
 
 DATE RANGE:
 Earliest Due Date: {df['Calculated Due Date'].min()}
@@ -775,6 +927,22 @@ Latest Due Date: {df['Calculated Due Date'].max()}
 
 This report was generated by the Machinery Maintenance Analysis Tool.
 """
+    return summary, details
+
+def generate_analysis_report(df):
+    """Generate a text-based analysis report"""
+    summary, details = _report_sections(df)
+    
+    # Timestamp and overdue count depend on the current time, so they stay outside the cache
+    report = f"""
+MACHINERY MAINTENANCE ANALYSIS REPORT
+Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+SUMMARY STATISTICS:
+{summary}
+- Overdue Items: {_overdue_count(df)}
+
+{details}"""
     return report
 
 if __name__ == "__main__":
@@ -1,9 +1,113 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from datetime import datetime
 import re
 from utils import FrequencyParser, DateUtils
 
+try:
+    import polars as pl
+except ImportError:  # polars is optional; fall back to pandas CSV parsing
+    pl = None
+
+POLARS_AVAILABLE = pl is not None
+
+# Version of the frame layout _clean_data produces. Cleaned frames are cached on disk keyed
+# on it (app._load_csv), so bump it whenever _clean_data changes its output.
+CLEANED_DATA_VERSION = 2
+
+# Low-cardinality text columns stored as categoricals (integer codes) after loading
+CATEGORICAL_COLUMNS = ['Vessel', 'Department', 'Machinery Location', 'Job Action', 'Job Code',
+                       'Job Status', 'Performing Rank', 'Function', 'Frequency']
+
+# Free-text columns stored as Arrow-backed strings even when the reader inferred numbers
+ARROW_STRING_COLUMNS = ['Title']
+
+def combine_dataframes(dataframes):
+    """Concatenate loaded frames, keeping categorical columns categorical"""
+    # Give each categorical column the same categories in every frame so the single
+    # pd.concat keeps them categorical instead of widening them to object first
+    aligned = {}
+    for col in CATEGORICAL_COLUMNS:
+        parts = [df[col] for df in dataframes if col in df.columns]
+        if len(parts) == len(dataframes) and all(isinstance(p.dtype, pd.CategoricalDtype) for p in parts):
+            categories = parts[0].cat.categories
+            for part in parts[1:]:
+                categories = categories.union(part.cat.categories)
+            aligned[col] = categories
+    if aligned:
+        recoded = []
+        for df in dataframes:
+            df = df.copy(deep=False)  # new column references only; the data is not copied
+            for col, categories in aligned.items():
+                df[col] = df[col].cat.set_categories(categories)
+            recoded.append(df)
+        dataframes = recoded
+    
+    combined = pd.concat(dataframes, ignore_index=True)
+    
+    # pd.concat falls back to object dtype when files have different categories
+    for col in CATEGORICAL_COLUMNS:
+        if col in combined.columns and not isinstance(combined[col].dtype, pd.CategoricalDtype):
+            parts = [df[col] for df in dataframes if col in df.columns]
+            if len(parts) == len(dataframes) and all(isinstance(p.dtype, pd.CategoricalDtype) for p in parts):
+                combined[col] = pd.api.types.union_categoricals(parts, sort_categories=True)
+            else:
+                combined[col] = combined[col].astype('category')
+    
+    return combined
+
+def name_blank_headers(columns):
+    """Name blank CSV headers 'Unnamed: i', as pandas.read_csv does"""
+    return [col if col.strip() else f"Unnamed: {i}" for i, col in enumerate(columns)]
+
+def mangle_duplicate_headers(columns):
+    """Rename repeated CSV headers 'X', 'X.1', 'X.2', ..., as pandas.read_csv does"""
+    names = list(columns)
+    counts = {}
+    for i, col in enumerate(names):
+        count = counts.get(col, 0)
+        while count > 0:
+            counts[col] = count + 1
+            col = f"{col}.{count}"
+            count = counts.get(col, 0)
+        names[i] = col
+        counts[col] = count + 1
+    return names
+
+def read_csv_arrow(file):
+    """Read a CSV with pyarrow's multi-threaded parser into a pandas-compatible frame"""
+    table = pacsv.read_csv(file, convert_options=pacsv.ConvertOptions(strings_can_be_null=True))
+    
+    # Columns with no values at all come back as Arrow null type; pandas reads them as float NaN
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+    
+    df = table.to_pandas()
+    # Arrow keeps repeated header names; pandas-style names keep every column addressable
+    df.columns = mangle_duplicate_headers(name_blank_headers(df.columns))
+    return df
+
+def join_values(df, by, col):
+    """Comma-join every non-null value of col within each by-group (row order)"""
+    values = df[[by, col]].dropna()
+    return values[col].astype(str).groupby(values[by], observed=True).agg(', '.join)
+
+def join_unique_values(df, by, col, limit=None):
+    """Comma-join the distinct values of col within each by-group (first-seen order)"""
+    pairs = df[[by, col]].dropna().drop_duplicates()
+    if limit is not None:
+        pairs = pairs.groupby(by, observed=True, sort=False).head(limit)
+    return pairs[col].astype(str).groupby(pairs[by], observed=True).agg(', '.join)
+
+def category_isin(series, values):
+    """Boolean numpy mask of categorical series values in values, matched on category codes"""
+    # Look the selected values up once in the categories, then compare integer codes
+    codes = series.cat.categories.get_indexer(values)
+    return np.isin(series.cat.codes.to_numpy(), codes[codes >= 0])
+
 class DataProcessor:
     """Main data processing class for machinery maintenance data"""
     
@@ -12,11 +116,29 @@ class DataProcessor:
         self.frequency_parser = FrequencyParser()
         self.date_utils = DateUtils()
     
-    def load_data(self, file):
+    def load_data(self, file, fast_io=False):
         """Load and clean data from uploaded CSV file"""
         try:
-            # Read CSV file
-            self.df = pd.read_csv(file)
+            # Read CSV file (polars when requested and installed, otherwise pyarrow;
+            # both are multi-threaded parsers)
+            self.df = None
+            if fast_io and POLARS_AVAILABLE:
+                try:
+                    self.df = pl.read_csv(file, infer_schema_length=10_000).to_pandas()
+                    # Match pandas naming for blank headers (e.g. the unnamed first column)
+                    self.df.columns = name_blank_headers(self.df.columns)
+                except pl.exceptions.PolarsError:
+                    # polars infers types from the first rows only and rejects later values
+                    # that do not fit; the Arrow/pandas readers below handle those files
+                    file.seek(0)
+            
+            if self.df is None:
+                try:
+                    self.df = read_csv_arrow(file)
+                except pa.ArrowInvalid:
+                    # Fall back to pandas for files the Arrow parser rejects
+                    file.seek(0)
+                    self.df = pd.read_csv(file)
             
             # Clean column names (remove BOM and whitespace)
             self.df.columns = self.df.columns.str.strip().str.replace('\ufeff', '')
@@ -34,13 +156,12 @@ class DataProcessor:
         # Remove completely empty rows
         self.df = self.df.dropna(how='all')
         
-        # Strip whitespace from string columns
-        string_columns = self.df.select_dtypes(include=['object']).columns
+        # Strip whitespace from string columns, then treat empty strings and 'nan'/'None'
+        # (missing values after the str conversion) as NaN in the same column pass
+        string_columns = self.df.select_dtypes(include=['object', 'string']).columns
         for col in string_columns:
-            self.df[col] = self.df[col].astype(str).str.strip()
-        
-        # Replace empty strings and 'nan' with NaN
-        self.df = self.df.replace(['', 'nan', 'None'], np.nan)
+            stripped = self.df[col].astype(str).str.strip()
+            self.df[col] = stripped.where(~stripped.isin(['', 'nan', 'None']))
         
         # Clean numeric columns
         if 'Remaining Running Hours' in self.df.columns:
@@ -53,98 +174,101 @@ class DataProcessor:
                 self.df['Machinery Running Hours'], errors='coerce'
             )
         
-        # Parse dates with flexible format handling
+        # Parse dates with flexible format handling (detected format first, inference as fallback)
         date_columns = ['Calculated Due Date', 'Last Done Date', 'Completion Date', 'Due Date', 'Next Due']
         for col in date_columns:
             if col in self.df.columns:
-                self.df[col] = pd.to_datetime(self.df[col], dayfirst=True, errors='coerce')
+                self.df[col] = self.date_utils.parse_date_column(self.df[col])
+        
+        # Due year for the year filter, computed once (nullable Int16 instead of datetime64)
+        if 'Calculated Due Date' in self.df.columns:
+            self.df['_due_year'] = self.df['Calculated Due Date'].dt.year.astype('Int16')
+        
+        # Convert low-cardinality text columns to categoricals
+        for col in CATEGORICAL_COLUMNS:
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype('category')
+        
+        # Convert the remaining text columns, and the free-text columns whatever type they
+        # were read as, to Arrow-backed strings
+        text_columns = self.df.select_dtypes(include=['object', 'string']).columns
+        text_columns = text_columns.union([col for col in ARROW_STRING_COLUMNS if col in self.df.columns], sort=False)
+        for col in text_columns:
+            self.df[col] = self.df[col].astype('string[pyarrow]')
     
     def filter_major_machinery(self, min_hours=4000, min_months=30, year_filter=None, vessel_filter=None, machinery_filter=None, job_action_filter=None):
         """Filter data for major machinery based on frequency criteria"""
         if self.df is None:
             raise Exception("No data loaded. Please load data first.")
         
-        # Create a copy for filtering
-        filtered_df = self.df.copy()
+        # Every condition is AND-ed into one positional mask over the loaded data, which is
+        # then sliced once; the loaded data itself is never modified
+        df = self.df
         
-        # Parse frequencies to comparable values
-        filtered_df['Frequency_Hours'] = filtered_df['Frequency'].apply(
-            self.frequency_parser.parse_to_hours
-        )
-        filtered_df['Frequency_Months'] = filtered_df['Frequency'].apply(
-            self.frequency_parser.parse_to_months
-        )
+        # Apply frequency filters with strict checking based on original frequency format:
+        # hour-based frequencies are compared in hours, otherwise month-based ones in months.
+        # Frequency strings repeat heavily, so each distinct value is parsed only once.
+        codes, uniques = pd.factorize(df['Frequency'])
+        frequencies = pd.Series(uniques, dtype=object)
+        frequency_text = frequencies.astype('string').str.lower()
+        is_hour_based = frequency_text.str.contains('hour', regex=False).fillna(False).to_numpy(dtype=bool)
+        is_month_based = ~is_hour_based & frequency_text.str.contains('month', regex=False).fillna(False).to_numpy(dtype=bool)
         
-        # Apply frequency filters with strict checking based on original frequency format
-        frequency_mask = pd.Series([False] * len(filtered_df))
+        # Each value is only parsed in the unit it is compared in
+        hours = self.frequency_parser.parse_series_to_hours(frequencies[is_hour_based])
+        months = self.frequency_parser.parse_series_to_months(frequencies[is_month_based])
         
-        for idx, freq_str in enumerate(filtered_df['Frequency']):
-            if pd.isna(freq_str) or freq_str == '':
-                continue
-            freq_str = str(freq_str).strip()
-            
-            # Check if it's an hour-based frequency
-            if 'hour' in freq_str.lower():
-                hours = self.frequency_parser.parse_to_hours(freq_str)
-                if hours and hours >= min_hours:
-                    frequency_mask.iloc[idx] = True
-            
-            # Check if it's a month-based frequency  
-            elif 'month' in freq_str.lower():
-                months = self.frequency_parser.parse_to_months(freq_str)
-                if months and months >= min_months:
-                    frequency_mask.iloc[idx] = True
-        
-        filtered_df = filtered_df[frequency_mask]
+        # Mask over the distinct values plus a trailing False for missing ones (code -1),
+        # broadcast back to the rows positionally through the codes
+        unique_mask = np.zeros(len(uniques) + 1, dtype=bool)
+        unique_mask[:-1][is_hour_based] = ((hours >= min_hours) & (hours != 0)).to_numpy()
+        unique_mask[:-1][is_month_based] = ((months >= min_months) & (months != 0)).to_numpy()
+        mask = unique_mask[codes]
         
         # Apply year filter if specified
         if year_filter and year_filter != "All Years":
             try:
                 target_year = int(year_filter)
-                due_dates = pd.to_datetime(filtered_df['Calculated Due Date'], errors='coerce')
-                filtered_df['Due_Year'] = due_dates.dt.year
-                year_mask = (filtered_df['Due_Year'] == target_year) | filtered_df['Due_Year'].isna()
-                filtered_df = filtered_df[year_mask]
+                due_year = df['_due_year']
+                mask &= ((due_year == target_year) | due_year.isna()).to_numpy(dtype=bool)
             except ValueError:
                 pass  # Skip year filtering if invalid year
         
         # Apply vessel filter if specified (supports multiple selections)
         if vessel_filter:
             if isinstance(vessel_filter, list) and len(vessel_filter) > 0:
-                vessel_mask = filtered_df['Vessel'].isin(vessel_filter)
-                filtered_df = filtered_df[vessel_mask]
+                mask &= category_isin(df['Vessel'], vessel_filter)
             elif isinstance(vessel_filter, str):
-                vessel_mask = filtered_df['Vessel'] == vessel_filter
-                filtered_df = filtered_df[vessel_mask]
+                mask &= (df['Vessel'] == vessel_filter).to_numpy()
         
         # Apply machinery location filter if specified (supports multiple selections)
         if machinery_filter:
             if isinstance(machinery_filter, list) and len(machinery_filter) > 0:
-                machinery_mask = filtered_df['Machinery Location'].isin(machinery_filter)
-                filtered_df = filtered_df[machinery_mask]
+                mask &= category_isin(df['Machinery Location'], machinery_filter)
             elif isinstance(machinery_filter, str) and machinery_filter != "All Locations":
-                machinery_mask = filtered_df['Machinery Location'] == machinery_filter
-                filtered_df = filtered_df[machinery_mask]
+                mask &= (df['Machinery Location'] == machinery_filter).to_numpy()
         
         # Apply job action filter if specified (supports multiple selections)
         if job_action_filter:
             if isinstance(job_action_filter, list) and len(job_action_filter) > 0:
-                job_action_mask = filtered_df['Job Action'].isin(job_action_filter)
-                filtered_df = filtered_df[job_action_mask]
+                mask &= category_isin(df['Job Action'], job_action_filter)
             elif isinstance(job_action_filter, str):
-                job_action_mask = filtered_df['Job Action'] == job_action_filter
-                filtered_df = filtered_df[job_action_mask]
+                mask &= (df['Job Action'] == job_action_filter).to_numpy()
         
-        # Remove helper columns
-        columns_to_drop = ['Frequency_Hours', 'Frequency_Months']
-        if 'Due_Year' in filtered_df.columns:
-            columns_to_drop.append('Due_Year')
+        filtered_df = df[mask]
         
-        for col in columns_to_drop:
-            if col in filtered_df.columns:
-                filtered_df = filtered_df.drop(columns=[col])
+        # Drop categories that were filtered out so counts only list values present, and
+        # create combined Job Code + Title column for display (Arrow-backed strings).
+        # assign() builds a new frame rather than writing into the boolean-indexed slice.
+        derived_columns = {
+            col: filtered_df[col].cat.remove_unused_categories()
+            for col in filtered_df.select_dtypes(include=['category']).columns
+        }
+        derived_columns['Job_Details'] = filtered_df['Job Code'].astype('string[pyarrow]').str.cat(
+            filtered_df['Title'], sep=' - ', na_rep=''
+        )
         
-        return filtered_df
+        return filtered_df.assign(**derived_columns)
     
     def get_summary_stats(self):
         """Get summary statistics for the loaded data"""
@@ -156,7 +280,7 @@ class DataProcessor:
             'vessels': self.df['Vessel'].nunique() if 'Vessel' in self.df.columns else 0,
             'departments': self.df['Department'].nunique() if 'Department' in self.df.columns else 0,
             'machinery_locations': self.df['Machinery Location'].nunique() if 'Machinery Location' in self.df.columns else 0,
-            'pending_jobs': len(self.df[self.df['Job Status'] == 'Pending']) if 'Job Status' in self.df.columns else 0,
+            'pending_jobs': int((self.df['Job Status'] == 'Pending').sum()) if 'Job Status' in self.df.columns else 0,
             'date_range': {
                 'min_date': self.df['Calculated Due Date'].min() if 'Calculated Due Date' in self.df.columns else None,
                 'max_date': self.df['Calculated Due Date'].max() if 'Calculated Due Date' in self.df.columns else None
@@ -178,15 +302,18 @@ class DataProcessor:
         if self.df is None or 'Machinery Location' not in self.df.columns:
             return pd.DataFrame()
         
-        breakdown = self.df.groupby('Machinery Location').agg({
-            'Job Code': 'count',
-            'Job Status': lambda x: (x == 'Pending').sum(),
-            'Department': lambda x: ', '.join(x.dropna().astype(str).unique()) if x.notna().any() else 'Unknown',
-            'Frequency': lambda x: ', '.join(x.dropna().astype(str).unique()[:3]) if x.notna().any() else 'Unknown'
+        # Pending flag as a column, so both counts are built-in aggregations in one groupby
+        breakdown = self.df[['Machinery Location', 'Job Code']].assign(
+            Pending=self.df['Job Status'] == 'Pending'
+        ).groupby('Machinery Location', observed=True).agg(**{
+            'Total Jobs': ('Job Code', 'count'),
+            'Pending Jobs': ('Pending', 'sum')
         })
         
-        # Rename columns manually
-        breakdown.columns = ['Total Jobs', 'Pending Jobs', 'Departments', 'Frequencies']
+        # Distinct departments / first three frequencies per location, joined without per-group lambdas
+        breakdown['Departments'] = join_unique_values(self.df, 'Machinery Location', 'Department')
+        breakdown['Frequencies'] = join_unique_values(self.df, 'Machinery Location', 'Frequency', limit=3)
+        breakdown[['Departments', 'Frequencies']] = breakdown[['Departments', 'Frequencies']].fillna('Unknown')
         
         return breakdown.sort_values('Total Jobs', ascending=False)
     
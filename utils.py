@@ -1,17 +1,31 @@
 import re
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 
+# Patterns for different frequency formats, compiled once for every parser instance
+HOUR_PATTERN = re.compile(r'(\d+)\s*hours?', re.IGNORECASE)
+MONTH_PATTERN = re.compile(r'(\d+)\s*months?', re.IGNORECASE)
+YEAR_PATTERN = re.compile(r'(\d+)\s*years?', re.IGNORECASE)
+DAY_PATTERN = re.compile(r'(\d+)\s*days?', re.IGNORECASE)
+WEEK_PATTERN = re.compile(r'(\d+)\s*weeks?', re.IGNORECASE)
+
+# Unambiguous date layouts that DateUtils.parse_date hands straight to strptime
+DATE_DISPATCH = [
+    (re.compile(r'\d{4}-\d{2}-\d{2}'), '%Y-%m-%d'),
+    (re.compile(r'\d{1,2}-[A-Za-z]{3}-\d{4}'), '%d-%b-%Y')
+]
+
 class FrequencyParser:
     """Utility class for parsing maintenance frequencies"""
     
     def __init__(self):
-        # Patterns for different frequency formats
-        self.hour_pattern = re.compile(r'(\d+)\s*hours?', re.IGNORECASE)
-        self.month_pattern = re.compile(r'(\d+)\s*months?', re.IGNORECASE)
-        self.year_pattern = re.compile(r'(\d+)\s*years?', re.IGNORECASE)
-        self.day_pattern = re.compile(r'(\d+)\s*days?', re.IGNORECASE)
-        self.week_pattern = re.compile(r'(\d+)\s*weeks?', re.IGNORECASE)
+        # Shared module-level patterns for different frequency formats
+        self.hour_pattern = HOUR_PATTERN
+        self.month_pattern = MONTH_PATTERN
+        self.year_pattern = YEAR_PATTERN
+        self.day_pattern = DAY_PATTERN
+        self.week_pattern = WEEK_PATTERN
     
     def parse_to_hours(self, frequency_str):
         """Parse frequency string to hours (for comparison)"""
@@ -89,6 +103,46 @@ class FrequencyParser:
         
         return None
     
+    @staticmethod
+    def _extract_number(text, pattern):
+        """First number captured by pattern in each string, as float (NaN when absent)"""
+        matches = text.str.extract(pattern.pattern, flags=pattern.flags, expand=False)
+        return pd.to_numeric(matches).astype('float64')
+    
+    def _parse_series(self, series, conversions):
+        """Apply (pattern, convert) pairs in order; later patterns only see unmatched values"""
+        text = series.astype('string').str.strip()
+        result = pd.Series(np.nan, index=series.index)
+        
+        for pattern, convert in conversions:
+            missing = result.isna() & text.notna()
+            if not missing.any():
+                break
+            result[missing] = convert(self._extract_number(text[missing], pattern))
+        return result
+    
+    def parse_series_to_hours(self, series):
+        """Vectorized parse_to_hours over a Series (NaN where unparseable)"""
+        # Same precedence and conversions as parse_to_hours: the first unit found wins
+        return self._parse_series(series, [
+            (self.hour_pattern, lambda hours: hours),
+            (self.month_pattern, lambda months: months * 30 * 24),
+            (self.year_pattern, lambda years: years * 365 * 24),
+            (self.day_pattern, lambda days: days * 24),
+            (self.week_pattern, lambda weeks: weeks * 7 * 24)
+        ])
+    
+    def parse_series_to_months(self, series):
+        """Vectorized parse_to_months over a Series (NaN where unparseable)"""
+        # Same precedence and conversions as parse_to_months: the first unit found wins
+        return self._parse_series(series, [
+            (self.month_pattern, lambda months: months),
+            (self.year_pattern, lambda years: years * 12),
+            (self.hour_pattern, lambda hours: (hours / 720).round(1)),
+            (self.day_pattern, lambda days: (days / 30).round(1)),
+            (self.week_pattern, lambda weeks: (weeks / 4.33).round(1))
+        ])
+    
     def get_frequency_category(self, frequency_str):
         """Categorize frequency into predefined categories"""
         hours = self.parse_to_hours(frequency_str)
@@ -115,12 +169,74 @@ class FrequencyParser:
 class DateUtils:
     """Utility class for date operations"""
     
+    # Explicit day-first formats probed before falling back to per-element inference
+    DATE_FORMATS = [
+        '%d-%b-%Y',
+        '%d-%b-%y',
+        '%d/%m/%Y',
+        '%d-%m-%Y',
+        '%d.%m.%Y',
+        '%Y-%m-%d',
+        '%d-%b-%Y %H:%M',
+        '%d/%m/%Y %H:%M',
+        '%Y-%m-%d %H:%M:%S'
+    ]
+    
+    @staticmethod
+    def detect_date_format(series, sample_size=100):
+        """Return the first known format that parses all sampled non-null values"""
+        sample = series.dropna().astype(str).head(sample_size)
+        if sample.empty:
+            return None
+        
+        for fmt in DateUtils.DATE_FORMATS:
+            try:
+                pd.to_datetime(sample, format=fmt)
+                return fmt
+            except (ValueError, TypeError):
+                continue
+        return None
+    
+    @staticmethod
+    def parse_date_column(series):
+        """Parse a column of date strings, using a detected format when possible"""
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series
+        
+        # Parse each distinct string once and broadcast the result back through the codes
+        codes, uniques = pd.factorize(series)
+        uniques = pd.Series(uniques, dtype=object)
+        
+        date_format = DateUtils.detect_date_format(uniques)
+        if date_format is None:
+            parsed = pd.to_datetime(uniques, dayfirst=True, errors='coerce')
+        else:
+            parsed = pd.to_datetime(uniques, format=date_format, errors='coerce')
+            
+            # Values outside the sampled format fall back to day-first inference
+            unparsed = parsed.isna()
+            if unparsed.any():
+                parsed[unparsed] = pd.to_datetime(uniques[unparsed], dayfirst=True, errors='coerce')
+        
+        # Missing values have code -1, which picks the trailing NaT
+        values = pd.DatetimeIndex(parsed).append(pd.DatetimeIndex([pd.NaT], dtype=parsed.dtype))
+        return pd.Series(values.take(codes), index=series.index, name=series.name)
+    
     @staticmethod
     def parse_date(date_str):
         """Parse date string to datetime object"""
         if pd.isna(date_str) or date_str == '':
             return None
         
+        # Common layouts are recognised by a cheap regex match instead of format inference
+        if isinstance(date_str, str):
+            for pattern, date_format in DATE_DISPATCH:
+                if pattern.fullmatch(date_str):
+                    try:
+                        return pd.Timestamp(datetime.strptime(date_str, date_format))
+                    except ValueError:
+                        break
+        
         try:
             return pd.to_datetime(date_str)
         except:
@@ -164,6 +280,22 @@ class DateUtils:
         except:
             return None
     
+    @staticmethod
+    def overdue_series(due_dates, reference_date=None):
+        """Vectorized is_overdue over a datetime Series (missing dates are never overdue)"""
+        if reference_date is None:
+            reference_date = datetime.now()
+        
+        return due_dates < pd.Timestamp(reference_date)
+    
+    @staticmethod
+    def days_until_due_series(due_dates, reference_date=None):
+        """Vectorized days_until_due over a datetime Series (NaN for missing dates)"""
+        if reference_date is None:
+            reference_date = datetime.now()
+        
+        return (due_dates - pd.Timestamp(reference_date)).dt.days
+    
     @staticmethod
     def get_quarter(date_obj):
         """Get quarter from datetime object"""